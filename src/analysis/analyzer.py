@@ -20,30 +20,69 @@ class TimeAnalyzer:
         """
         self.processor = processor
         self.data = processor.get_dataframe()
+        self._period_data = {}
+        self._period_analyses = {}
+        self._summary_stats = None
+
+    @staticmethod
+    def _period_key(period: TimePeriod) -> tuple:
+        """Hashable memo key for a period (TimePeriod dataclasses are unhashable)."""
+        return (type(period), str(period))
+
+    def get_period_data(self, period: TimePeriod) -> pd.DataFrame:
+        """
+        Get the activity records that fall within a time period.
+
+        Filtered frames are memoized per period, so analysis and chart
+        generation for the same period share a single filter pass.
+
+        Args:
+            period: TimePeriod (Week, Month, or Year)
+
+        Returns:
+            Filtered DataFrame
+        """
+        key = self._period_key(period)
+        if key not in self._period_data:
+            if isinstance(period, Week):
+                filtered = self.processor.filter_by_period(
+                    period.year, period.month, period.week
+                )
+            elif isinstance(period, Month):
+                filtered = self.processor.filter_by_period(
+                    period.year, period.month
+                )
+            elif isinstance(period, Year):
+                filtered = self.processor.filter_by_period(period.year)
+            else:
+                raise ValueError(f"Unsupported period type: {type(period)}")
+            self._period_data[key] = filtered
+
+        return self._period_data[key]
 
     def analyze_period(self, period: TimePeriod) -> Dict:
         """
         Analyze a specific time period.
 
+        Results are memoized per period; callers should treat the returned
+        dictionary as read-only.
+
         Args:
             period: TimePeriod (Week, Month, or Year)
 
         Returns:
             Dictionary containing analysis results
         """
+        key = self._period_key(period)
+        if key not in self._period_analyses:
+            self._period_analyses[key] = self._analyze_period(period)
+
+        return self._period_analyses[key]
+
+    def _analyze_period(self, period: TimePeriod) -> Dict:
+        """Compute the analysis for a period (see analyze_period)."""
         # Filter data for the period
-        if isinstance(period, Week):
-            filtered = self.processor.filter_by_period(
-                period.year, period.month, period.week
-            )
-        elif isinstance(period, Month):
-            filtered = self.processor.filter_by_period(
-                period.year, period.month
-            )
-        elif isinstance(period, Year):
-            filtered = self.processor.filter_by_period(period.year)
-        else:
-            raise ValueError(f"Unsupported period type: {type(period)}")
+        filtered = self.get_period_data(period)
 
         if filtered.empty:
             return {
@@ -60,6 +99,7 @@ class TimeAnalyzer:
 
         # Activity type distribution
         type_counts = filtered['Activity_Type'].value_counts()
+        type_counts = type_counts[type_counts > 0]
         type_hours = type_counts * self.HOURS_PER_BLOCK
         type_percentages = (type_counts / total_blocks * 100).round(2)
 
@@ -73,7 +113,8 @@ class TimeAnalyzer:
         }
 
         # Day distribution
-        day_counts = filtered.groupby('Day')['Activity_Type'].value_counts()
+        day_counts = filtered.groupby('Day', observed=True)['Activity_Type'].value_counts()
+        day_counts = day_counts[day_counts > 0]
         daily_breakdown = {}
         for (day, activity_type), count in day_counts.items():
             if day not in daily_breakdown:
@@ -88,7 +129,7 @@ class TimeAnalyzer:
         if not activity_details.empty:
             top_activities_counts = (
                 activity_details
-                .groupby(['Activity_Type', 'Activity_Detail'])
+                .groupby(['Activity_Type', 'Activity_Detail'], observed=True)
                 .size()
                 .sort_values(ascending=False)
                 .head(10)
@@ -106,7 +147,8 @@ class TimeAnalyzer:
             top_activities = []
 
         # Time slot patterns
-        time_patterns = filtered.groupby('Time')['Activity_Type'].value_counts()
+        time_patterns = filtered.groupby('Time', observed=True)['Activity_Type'].value_counts()
+        time_patterns = time_patterns[time_patterns > 0]
         time_breakdown = {}
         for (time_slot, activity_type), count in time_patterns.items():
             if time_slot not in time_breakdown:
@@ -148,23 +190,45 @@ class TimeAnalyzer:
         """
         Get overall summary statistics for all data.
 
+        The result is computed once per analyzer; callers should treat the
+        returned dictionary as read-only.
+
         Returns:
             Dictionary with summary statistics
         """
+        if self._summary_stats is None:
+            self._summary_stats = self._compute_summary_stats()
+
+        return self._summary_stats
+
+    def _compute_summary_stats(self) -> Dict:
+        """Compute the summary statistics (see get_summary_stats)."""
         total_blocks = len(self.data)
         total_hours = total_blocks * self.HOURS_PER_BLOCK
 
+        # Single pass over the data; every aggregate below is derived from it
+        counts = self.data.groupby(
+            ['Year', 'Month', 'Week', 'Day', 'Activity_Type'], observed=True
+        ).size()
+
         # Activity type distribution
-        type_counts = self.data['Activity_Type'].value_counts()
+        type_counts = (
+            counts.groupby(level='Activity_Type', observed=True)
+            .sum()
+            .sort_values(ascending=False)
+        )
         type_hours = type_counts * self.HOURS_PER_BLOCK
 
         # Date range
-        years = sorted(self.data['Year'].unique())
-        months = self.data.groupby('Year')['Month'].nunique().sum()
-        weeks = len(self.data.groupby(['Year', 'Month', 'Week']))
+        tracked_days = counts.index.droplevel('Activity_Type').unique()
+        tracked_weeks = tracked_days.droplevel('Day').unique()
+        tracked_months = tracked_weeks.droplevel('Week').unique()
+        years = sorted(tracked_months.get_level_values('Year').unique())
+        months = len(tracked_months)
+        weeks = len(tracked_weeks)
 
         # Average hours per day
-        days_tracked = len(self.data.groupby(['Year', 'Month', 'Week', 'Day']))
+        days_tracked = len(tracked_days)
         avg_hours_per_day = total_hours / days_tracked if days_tracked > 0 else 0
 
         return {
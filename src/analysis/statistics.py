@@ -31,11 +31,11 @@ class StatisticsCalculator:
             DataFrame with average hours
         """
         if group_by == 'Week':
-            grouped = self.data.groupby(['Year', 'Month', 'Week', 'Activity_Type'])
+            grouped = self.data.groupby(['Year', 'Month', 'Week', 'Activity_Type'], observed=True)
         elif group_by == 'Month':
-            grouped = self.data.groupby(['Year', 'Month', 'Activity_Type'])
+            grouped = self.data.groupby(['Year', 'Month', 'Activity_Type'], observed=True)
         elif group_by == 'Year':
-            grouped = self.data.groupby(['Year', 'Activity_Type'])
+            grouped = self.data.groupby(['Year', 'Activity_Type'], observed=True)
         else:
             raise ValueError(f"Invalid group_by: {group_by}")
 
@@ -59,10 +59,11 @@ class StatisticsCalculator:
             data = data[data['Activity_Type'] == activity_type]
 
         # Group by week and count
-        weekly = data.groupby(['Year', 'Month', 'Week']).size().reset_index(name='Blocks')
+        weekly = data.groupby(['Year', 'Month', 'Week'], observed=True).size().reset_index(name='Blocks')
         weekly['Hours'] = weekly['Blocks'] * self.HOURS_PER_BLOCK
-        weekly['Period'] = weekly.apply(
-            lambda x: f"{x['Year']}-M{x['Month']}W{x['Week']}", axis=1
+        weekly['Period'] = (
+            weekly['Year'].astype(str) + '-M' + weekly['Month'].astype(str)
+            + 'W' + weekly['Week'].astype(str)
         )
 
         return weekly
@@ -74,15 +75,12 @@ class StatisticsCalculator:
         Returns:
             DataFrame with daily patterns
         """
-        daily = self.data.groupby(['Day', 'Activity_Type']).size().reset_index(name='Blocks')
+        daily = self.data.groupby(['Day', 'Activity_Type'], observed=True).size().reset_index(name='Blocks')
         daily['Hours'] = daily['Blocks'] * self.HOURS_PER_BLOCK
 
         # Calculate percentages
-        total_by_day = daily.groupby('Day')['Blocks'].sum()
-        daily['Percentage'] = daily.apply(
-            lambda x: round(x['Blocks'] / total_by_day[x['Day']] * 100, 2),
-            axis=1
-        )
+        total_by_day = daily.groupby('Day', observed=True)['Blocks'].transform('sum')
+        daily['Percentage'] = (daily['Blocks'] / total_by_day * 100).round(2)
 
         return daily
 
@@ -93,7 +91,7 @@ class StatisticsCalculator:
         Returns:
             DataFrame with time slot patterns
         """
-        time_patterns = self.data.groupby(['Time', 'Activity_Type']).size().reset_index(name='Frequency')
+        time_patterns = self.data.groupby(['Time', 'Activity_Type'], observed=True).size().reset_index(name='Frequency')
 
         return time_patterns
 
@@ -113,7 +111,7 @@ class StatisticsCalculator:
 
         productive_data = self.data[self.data['Activity_Type'].isin(productive_types)]
 
-        time_counts = productive_data.groupby('Time').size().reset_index(name='Frequency')
+        time_counts = productive_data.groupby('Time', observed=True).size().reset_index(name='Frequency')
         time_counts = time_counts.sort_values('Frequency', ascending=False)
 
         return time_counts
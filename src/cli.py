@@ -1,18 +1,16 @@
 """Command-line interface for time analysis."""
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 from typing import Optional
 
-from .data.loader import DataLoader
-from .data.processor import DataProcessor
 from .models.time_period import Week, Month, Year
-from .analysis.analyzer import TimeAnalyzer
-from .analysis.statistics import StatisticsCalculator
-from .visualization.charts import ChartGenerator
-from .visualization.exporter import VisualizationExporter
-from .reports.markdown import MarkdownReportGenerator
+
+# The data, analysis, visualization and report modules pull in pandas and
+# plotly; they are imported inside the command handlers so that --help and
+# argument errors return without paying for those imports
 
 
 class TimeAnalysisCLI:
@@ -52,6 +50,8 @@ Examples:
         analyze_parser.add_argument('data_path', help='Path to data file or directory')
         analyze_parser.add_argument('--output', '-o', default='output',
                                    help='Output directory (default: output)')
+        analyze_parser.add_argument('--no-cache', action='store_true',
+                                   help='Re-read data files instead of using the parse cache')
 
         # Period selection (mutually exclusive)
         period_group = analyze_parser.add_mutually_exclusive_group()
@@ -78,12 +78,16 @@ Examples:
         compare_parser.add_argument('--years', help='Comma-separated years (e.g., "2023,2024")')
         compare_parser.add_argument('--output', '-o', default='output',
                                    help='Output directory (default: output)')
+        compare_parser.add_argument('--no-cache', action='store_true',
+                                   help='Re-read data files instead of using the parse cache')
 
         # Summary command
         summary_parser = subparsers.add_parser('summary', help='Generate overall summary')
         summary_parser.add_argument('data_path', help='Path to data file or directory')
         summary_parser.add_argument('--output', '-o', default='output',
                                    help='Output directory (default: output)')
+        summary_parser.add_argument('--no-cache', action='store_true',
+                                   help='Re-read data files instead of using the parse cache')
 
         return parser
 
@@ -102,10 +106,13 @@ Examples:
         elif parsed_args.command == 'summary':
             self._run_summary(parsed_args)
 
-    def _load_data(self, data_path: str) -> tuple:
+    def _load_data(self, data_path: str, use_cache: bool = True) -> tuple:
         """Load and process data."""
+        from .data.loader import DataLoader, DEFAULT_CACHE_DIR
+        from .data.processor import DataProcessor
+
         print(f"\n📂 Loading data from: {data_path}")
-        loader = DataLoader(data_path)
+        loader = DataLoader(data_path, cache_dir=DEFAULT_CACHE_DIR if use_cache else None)
         raw_data = loader.load()
 
         print("⚙️  Processing data...")
@@ -116,12 +123,17 @@ Examples:
 
     def _run_analyze(self, args):
         """Run analysis command."""
+        from .analysis.analyzer import TimeAnalyzer
+        from .visualization.charts import ChartGenerator
+        from .visualization.exporter import VisualizationExporter
+        from .reports.markdown import MarkdownReportGenerator
+
         print("\n" + "="*60)
         print("TIME TRACKING ANALYSIS")
         print("="*60)
 
         # Load data
-        processor, raw_data = self._load_data(args.data_path)
+        processor, raw_data = self._load_data(args.data_path, use_cache=not args.no_cache)
 
         # Create analyzer
         analyzer = TimeAnalyzer(processor)
@@ -164,57 +176,42 @@ Examples:
         if period and 'error' not in analysis:
             chart_gen = ChartGenerator(processor.get_dataframe())
 
-            # Filter data for period
-            if isinstance(period, Week):
-                period_data = processor.filter_by_period(period.year, period.month, period.week)
-            elif isinstance(period, Month):
-                period_data = processor.filter_by_period(period.year, period.month)
-            elif isinstance(period, Year):
-                period_data = processor.filter_by_period(period.year)
-            else:
-                period_data = processor.get_dataframe()
+            # Reuse the rows already filtered for the analysis
+            period_data = analyzer.get_period_data(period)
 
             if not period_data.empty:
                 print("\n📊 Generating visualizations...")
 
+                figures = {}
+
                 # Distribution chart
-                fig = chart_gen.create_period_distribution(
+                figures[f"{period_name}_distribution"] = chart_gen.create_period_distribution(
                     period_data, period.label, type(period).__name__
                 )
-                if not args.no_html:
-                    exporter.export_html(fig, f"{period_name}_distribution")
-                if not args.no_images:
-                    exporter.export_image(fig, f"{period_name}_distribution")
 
                 # Daily breakdown
                 if len(period_data['Day'].unique()) > 1:
-                    fig = chart_gen.create_daily_breakdown(period_data, period.label)
-                    if not args.no_html:
-                        exporter.export_html(fig, f"{period_name}_daily")
-                    if not args.no_images:
-                        exporter.export_image(fig, f"{period_name}_daily")
+                    figures[f"{period_name}_daily"] = chart_gen.create_daily_breakdown(
+                        period_data, period.label
+                    )
 
                 # Pie chart
-                fig = chart_gen.create_pie_chart(period_data, period.label)
-                if not args.no_html:
-                    exporter.export_html(fig, f"{period_name}_pie")
-                if not args.no_images:
-                    exporter.export_image(fig, f"{period_name}_pie")
+                figures[f"{period_name}_pie"] = chart_gen.create_pie_chart(period_data, period.label)
 
                 # Top activities
                 if analysis.get('top_activities'):
-                    fig = chart_gen.create_top_activities_chart(analysis['top_activities'])
-                    if not args.no_html:
-                        exporter.export_html(fig, f"{period_name}_top_activities")
-                    if not args.no_images:
-                        exporter.export_image(fig, f"{period_name}_top_activities")
+                    figures[f"{period_name}_top_activities"] = chart_gen.create_top_activities_chart(
+                        analysis['top_activities']
+                    )
 
                 # Time heatmap
-                fig = chart_gen.create_time_heatmap(period_data, period.label)
+                figures[f"{period_name}_heatmap"] = chart_gen.create_time_heatmap(period_data, period.label)
+
                 if not args.no_html:
-                    exporter.export_html(fig, f"{period_name}_heatmap")
+                    for name, fig in figures.items():
+                        exporter.export_html(fig, name)
                 if not args.no_images:
-                    exporter.export_image(fig, f"{period_name}_heatmap")
+                    exporter.export_images(figures)
 
         # Generate markdown report
         if not args.no_markdown and period:
@@ -229,12 +226,17 @@ Examples:
 
     def _run_compare(self, args):
         """Run comparison command."""
+        from .analysis.analyzer import TimeAnalyzer
+        from .visualization.charts import ChartGenerator
+        from .visualization.exporter import VisualizationExporter
+        from .reports.markdown import MarkdownReportGenerator
+
         print("\n" + "="*60)
         print("TIME TRACKING COMPARISON")
         print("="*60)
 
         # Load data
-        processor, _ = self._load_data(args.data_path)
+        processor, _ = self._load_data(args.data_path, use_cache=not args.no_cache)
 
         # Parse periods
         periods = []
@@ -271,13 +273,7 @@ Examples:
         # Create comparison data for charts
         periods_data = {}
         for period in periods:
-            if isinstance(period, Week):
-                period_data = processor.filter_by_period(period.year, period.month, period.week)
-            elif isinstance(period, Month):
-                period_data = processor.filter_by_period(period.year, period.month)
-            elif isinstance(period, Year):
-                period_data = processor.filter_by_period(period.year)
-
+            period_data = analyzer.get_period_data(period)
             if not period_data.empty:
                 periods_data[period.label] = period_data
 
@@ -297,12 +293,18 @@ Examples:
 
     def _run_summary(self, args):
         """Run summary command."""
+        from .analysis.analyzer import TimeAnalyzer
+        from .analysis.statistics import StatisticsCalculator
+        from .visualization.charts import ChartGenerator
+        from .visualization.exporter import VisualizationExporter
+        from .reports.markdown import MarkdownReportGenerator
+
         print("\n" + "="*60)
         print("TIME TRACKING SUMMARY")
         print("="*60)
 
         # Load data
-        processor, _ = self._load_data(args.data_path)
+        processor, _ = self._load_data(args.data_path, use_cache=not args.no_cache)
 
         # Generate summary
         analyzer = TimeAnalyzer(processor)
@@ -339,6 +341,15 @@ Examples:
 
 def main():
     """Main entry point."""
+    # Loader and exporter progress goes through the package's loggers; show
+    # it on stdout alongside the rest of the CLI output without turning on
+    # INFO logging for third-party libraries
+    package_logger = logging.getLogger(__package__)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
     cli = TimeAnalysisCLI()
     cli.run()
 
@@ -1,25 +1,61 @@
 """Data loader for CSV and Excel files."""
 
+import numpy as np
 import pandas as pd
+from packaging.version import Version
 from pathlib import Path
 from typing import List, Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
 import re
 import warnings
 
-warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+logger = logging.getLogger(__name__)
+
+# Use the Rust-based calamine reader for Excel files when it is installed
+# and pandas supports it (>= 2.2); otherwise let pandas pick its default
+# (openpyxl)
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine' if Version(pd.__version__) >= Version('2.2') else None
+except ImportError:
+    EXCEL_ENGINE = None
+if EXCEL_ENGINE is None:
+    # openpyxl warns about workbook features it does not read (styles,
+    # data validation); calamine never does, so only silence it here
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+DAY_ORDER = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+DAY_DTYPE = pd.CategoricalDtype(DAY_ORDER, ordered=True)
+
+# Filename patterns, e.g. "2023 Time-1.1.csv" (year, month, week) and the
+# year prefix of Excel workbooks
+_FILENAME_RE = re.compile(r'(\d{4})\s+[Tt]ime-(\d+)\.(\d+)')
+_YEAR_RE = re.compile(r'(\d{4})')
+
+# Default location for cached parsed data; bump the version whenever the
+# layout of the loaded DataFrame changes so stale caches are ignored
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'time_analysis'
+_CACHE_VERSION = 1
 
 
 class DataLoader:
     """Load time tracking data from CSV or Excel files."""
 
-    def __init__(self, data_path: Union[str, Path]):
+    def __init__(self, data_path: Union[str, Path],
+                 cache_dir: Optional[Union[str, Path]] = None):
         """
         Initialize data loader.
 
         Args:
             data_path: Path to a single file or directory containing data files
+            cache_dir: Optional directory where parsed data is cached between
+                      runs; the cache is keyed on the input files' names,
+                      sizes and modification times
         """
         self.data_path = Path(data_path)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.raw_data = []
 
     def load(self) -> pd.DataFrame:
@@ -29,27 +65,86 @@ class DataLoader:
         Returns:
             DataFrame with columns: Time, Day, Activity, Month, Week, Year
         """
+        if not self.data_path.exists():
+            raise ValueError(f"Path does not exist: {self.data_path}")
+
+        cache_path = self._cache_path() if self.cache_dir is not None else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                data = pd.read_pickle(cache_path)
+            except Exception as e:
+                # Truncated or otherwise unreadable entry: drop it and re-parse
+                logger.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+                cache_path.unlink(missing_ok=True)
+            else:
+                logger.info("Loaded cached data for %s", self.data_path)
+                return data
+
+        self.raw_data = []
         if self.data_path.is_file():
             self._load_single_file(self.data_path)
-        elif self.data_path.is_dir():
-            self._load_directory(self.data_path)
         else:
-            raise ValueError(f"Path does not exist: {self.data_path}")
+            self._load_directory(self.data_path)
 
         if not self.raw_data:
             raise ValueError("No data was loaded")
 
-        return pd.concat(self.raw_data, ignore_index=True)
+        data = pd.concat(self.raw_data, ignore_index=True)
+
+        # Release the per-file frames so they are not kept alive next to
+        # the combined result for the lifetime of the loader
+        self.raw_data = []
+
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Entries for older versions of the same input are never read
+            # again, so replace them rather than letting them pile up
+            prefix = cache_path.name.split('-', 1)[0]
+            for stale in cache_path.parent.glob(f"{prefix}-*.pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+            data.to_pickle(cache_path)
+
+        return data
+
+    def _cache_path(self) -> Path:
+        """
+        Get the cache file for the current input files.
+
+        The name is "<input path hash>-<contents hash>.pkl", so entries for
+        the same input path can be found and replaced when its files change.
+        """
+        if self.data_path.is_dir():
+            files = (sorted(self.data_path.glob("*.csv")) +
+                     sorted(self.data_path.glob("*.xlsx")) +
+                     sorted(self.data_path.glob("*.xls")))
+        else:
+            files = [self.data_path]
+
+        path_key = hashlib.sha1(str(self.data_path.resolve()).encode()).hexdigest()
+
+        # Pickles are tied to the pandas/numpy versions that wrote them
+        key = hashlib.sha1(
+            f"v{_CACHE_VERSION}:pandas{pd.__version__}:numpy{np.__version__}".encode()
+        )
+        for file in files:
+            stat = file.stat()
+            key.update(f"|{file.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+        return self.cache_dir / f"{path_key}-{key.hexdigest()}.pkl"
 
     def _load_directory(self, directory: Path):
         """Load all CSV and Excel files from a directory."""
-        # Find CSV files
+        # Find CSV files. Each file is parsed independently, so read them
+        # concurrently and collect the results in filename order.
         csv_files = sorted(directory.glob("*.csv"))
-        for csv_file in csv_files:
-            try:
-                self._load_single_file(csv_file)
-            except Exception as e:
-                print(f"Warning: Failed to load {csv_file}: {e}")
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(self._read_csv_file, f) for f in csv_files]
+            for csv_file, future in zip(csv_files, futures):
+                try:
+                    self._add_csv_data(csv_file, future.result())
+                except Exception as e:
+                    logger.warning("Failed to load %s: %s", csv_file, e)
 
         # Find Excel files
         excel_files = sorted(directory.glob("*.xlsx")) + sorted(directory.glob("*.xls"))
@@ -57,7 +152,7 @@ class DataLoader:
             try:
                 self._load_excel_file(excel_file)
             except Exception as e:
-                print(f"Warning: Failed to load {excel_file}: {e}")
+                logger.warning("Failed to load %s: %s", excel_file, e)
 
     def _load_single_file(self, file_path: Path):
         """Load a single file (CSV or Excel)."""
@@ -75,86 +170,126 @@ class DataLoader:
         Expected format: "YYYY Time-M.W.csv" or similar
         Example: "2023 Time-1.1.csv" -> (2023, 1, 1)
         """
-        # Pattern: YYYY Time-M.W
-        pattern = r'(\d{4})\s+[Tt]ime-(\d+)\.(\d+)'
-        match = re.search(pattern, filename)
-
-        if match:
-            year = int(match.group(1))
-            month = int(match.group(2))
-            week = int(match.group(3))
-            return year, month, week
+        match = _FILENAME_RE.search(filename)
+        if not match:
+            return None
 
-        return None
+        year, month, week = map(int, match.groups())
+        return year, month, week
 
     def _load_csv_file(self, csv_file: Path):
         """Load a single CSV file."""
+        self._add_csv_data(csv_file, self._read_csv_file(csv_file))
+
+    def _add_csv_data(self, csv_file: Path, df_melted: Optional[pd.DataFrame]):
+        """Store data read from a CSV file."""
+        if df_melted is None:
+            return
+
+        self.raw_data.append(df_melted)
+        year, month, week = self._parse_filename(csv_file.name)
+        logger.info("Loaded %s: %s-M%sW%s", csv_file.name, year, month, week)
+
+    def _read_csv_file(self, csv_file: Path) -> Optional[pd.DataFrame]:
+        """
+        Read a single CSV file into long format.
+
+        Does not touch loader state, so it is safe to run in worker threads.
+
+        Returns:
+            Melted DataFrame, or None if the file was skipped
+        """
         # Parse filename to get year, month, week
         parsed = self._parse_filename(csv_file.name)
         if not parsed:
-            print(f"Warning: Could not parse filename {csv_file.name}, skipping")
-            return
+            logger.warning("Could not parse filename %s, skipping", csv_file.name)
+            return None
 
         year, month, week = parsed
 
-        # Read CSV, skipping first row (header), using second row as column names
-        df = pd.read_csv(csv_file, skiprows=1, encoding='utf-8-sig')
-
+        # Read CSV, skipping first row (header), using second row as column names.
+        # Cells stay plain strings until processing, so skip type and NaN
+        # inference and ignore anything past the Time + 7 day columns.
         # Expected columns: Time, Day1, Day2, ..., Day7
-        # First column should be Time
-        if len(df.columns) < 2:
-            print(f"Warning: Insufficient columns in {csv_file.name}")
-            return
+        # First column should be Time; usecols raises on shorter files
+        try:
+            df = pd.read_csv(
+                csv_file,
+                skiprows=1,
+                encoding='utf-8-sig',
+                engine='c',
+                dtype=str,
+                na_filter=False,
+                usecols=range(8)
+            )
+        except ValueError:
+            logger.warning("Insufficient columns in %s", csv_file.name)
+            return None
 
         # Rename columns to standard format
-        weekdays = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
         time_col = df.columns[0]
         day_cols = df.columns[1:8]  # Next 7 columns are days
 
         # Keep only relevant rows (time slots, not summary rows at bottom)
         # Filter out rows where Time doesn't look like a time (e.g., "08:00")
-        df = df[df[time_col].astype(str).str.match(r'^\d{2}:\d{2}$', na=False)]
+        df = df[df[time_col].str.match(r'^\d{2}:\d{2}$', na=False)]
 
         # Rename for consistency
         rename_dict = {time_col: 'Time'}
         for i, day_col in enumerate(day_cols):
-            if i < len(weekdays):
-                rename_dict[day_col] = weekdays[i]
+            if i < len(DAY_ORDER):
+                rename_dict[day_col] = DAY_ORDER[i]
 
         df = df.rename(columns=rename_dict)
 
-        # Melt the dataframe
-        df_melted = df.melt(
-            id_vars=['Time'],
-            value_vars=weekdays,
-            var_name='Day',
-            value_name='Activity'
-        )
+        return self._to_long_format(df, year, month, week)
 
-        # Add metadata
-        df_melted['Month'] = month
-        df_melted['Week'] = week
-        df_melted['Year'] = year
+    def _to_long_format(self, df: pd.DataFrame, year: int, month: int, week: int) -> pd.DataFrame:
+        """
+        Convert a weekly sheet from wide to long format.
 
-        self.raw_data.append(df_melted)
-        print(f"Loaded {csv_file.name}: {year}-M{month}W{week}")
+        Equivalent to melting the day columns, but the long columns are built
+        directly with numpy instead of going through DataFrame.melt.
+
+        Args:
+            df: DataFrame with a Time column and one column per day in DAY_ORDER
+            year: Year of the sheet
+            month: Month of the sheet
+            week: Week of the sheet
+
+        Returns:
+            DataFrame with columns: Time, Day, Activity, Month, Week, Year
+        """
+        n_slots = len(df)
+        day_codes = np.repeat(np.arange(len(DAY_ORDER), dtype=np.int8), n_slots)
+
+        return pd.DataFrame({
+            'Time': np.tile(df['Time'].to_numpy(), len(DAY_ORDER)),
+            'Day': pd.Categorical.from_codes(day_codes, dtype=DAY_DTYPE),
+            # Column-major ravel keeps all of Sunday first, then Monday, ...
+            'Activity': df[DAY_ORDER].to_numpy().ravel(order='F'),
+            'Month': month,
+            'Week': week,
+            'Year': year
+        })
 
     def _load_excel_file(self, excel_file: Path):
         """Load an Excel file with multiple sheets."""
-        excel_data = pd.ExcelFile(excel_file)
-
         # Try to extract year from filename
-        year_match = re.search(r'(\d{4})', excel_file.name)
+        year_match = _YEAR_RE.search(excel_file.name)
         default_year = int(year_match.group(1)) if year_match else 2024
 
-        for sheet_name in excel_data.sheet_names:
-            try:
-                self._load_excel_sheet(excel_file, sheet_name, default_year)
-            except Exception as e:
-                print(f"Warning: Failed to load sheet {sheet_name}: {e}")
-
-    def _load_excel_sheet(self, excel_file: Path, sheet_name: str, year: int):
-        """Load a single sheet from an Excel file."""
+        # Open the workbook once and parse every sheet from it
+        with pd.ExcelFile(excel_file, engine=EXCEL_ENGINE) as excel_data:
+            for sheet_name in excel_data.sheet_names:
+                try:
+                    self._load_excel_sheet(excel_data, excel_file, sheet_name, default_year)
+                except Exception as e:
+                    logger.warning("Failed to load sheet %s: %s", sheet_name, e)
+
+    def _load_excel_sheet(self, excel_data: pd.ExcelFile, excel_file: Path,
+                          sheet_name: str, year: int):
+        """Load a single sheet from an already opened Excel workbook."""
         # Parse sheet name (format: M.W or similar)
         if isinstance(sheet_name, float):
             sheet_name = str(int(sheet_name))
@@ -172,28 +307,14 @@ class DataLoader:
             return
 
         # Read the sheet
-        df = pd.read_excel(
-            excel_file,
-            sheet_name=sheet_name,
+        df = excel_data.parse(
+            sheet_name,
             skiprows=1,
             usecols="A:H"
         )
 
         # Rename columns
-        weekdays = ['Time', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        df.columns = weekdays
-
-        # Melt the dataframe
-        df_melted = df.melt(
-            id_vars=['Time'],
-            value_vars=weekdays[1:],
-            var_name='Day',
-            value_name='Activity'
-        )
-
-        df_melted['Month'] = month
-        df_melted['Week'] = week
-        df_melted['Year'] = year
+        df.columns = ['Time'] + DAY_ORDER
 
-        self.raw_data.append(df_melted)
-        print(f"Loaded sheet {sheet_name} from {excel_file.name}")
+        self.raw_data.append(self._to_long_format(df, year, month, week))
+        logger.info("Loaded sheet %s from %s", sheet_name, excel_file.name)
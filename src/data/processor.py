@@ -1,8 +1,46 @@
 """Data processor for converting raw data to structured activities."""
 
+import numpy as np
 import pandas as pd
 from typing import List, Optional
-from ..models.activity import Activity
+import logging
+from ..models.activity import Activity, ActivityType
+from .loader import DAY_DTYPE
+
+logger = logging.getLogger(__name__)
+
+# Arrow-backed strings keep activity text in one contiguous buffer, which
+# makes the .str operations below much cheaper; fall back to the default
+# string storage when pyarrow is not installed
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    STRING_DTYPE = pd.StringDtype()
+
+PROCESSED_COLUMNS = [
+    'Year', 'Month', 'Week', 'Day', 'Time',
+    'Activity_Type', 'Activity_Code', 'Activity_Detail'
+]
+
+# Low-cardinality columns are stored as categoricals / small ints so the
+# repeated groupbys in the analysis layer hash integer codes, not strings
+PROCESSED_DTYPES = {
+    'Year': 'int16',
+    'Month': 'int8',
+    'Week': 'int8',
+    'Day': DAY_DTYPE,
+    'Activity_Type': pd.CategoricalDtype([at.label for at in ActivityType]),
+    'Activity_Code': pd.CategoricalDtype([at.code for at in ActivityType]),
+}
+
+# Position of each code in ActivityType (shared by both activity
+# categoricals), indexed by the ASCII code point of either letter case;
+# -1 marks characters that are not activity codes
+_TYPE_LOOKUP = np.full(128, -1, dtype=np.int8)
+for _i, _at in enumerate(ActivityType):
+    _TYPE_LOOKUP[ord(_at.code.upper())] = _i
+    _TYPE_LOOKUP[ord(_at.code.lower())] = _i
 
 
 class DataProcessor:
@@ -26,40 +64,61 @@ class DataProcessor:
         Returns:
             DataFrame with processed activity data
         """
-        processed_rows = []
-
-        for _, row in self.raw_data.iterrows():
-            activity = Activity.parse_from_string(
-                activity_str=row['Activity'],
-                time_slot=str(row['Time']),
-                day=row['Day'],
-                month=int(row['Month']),
-                week=int(row['Week']),
-                year=int(row['Year'])
-            )
-
-            if activity:
-                self.activities.append(activity)
-                processed_rows.append({
-                    'Year': activity.year,
-                    'Month': activity.month,
-                    'Week': activity.week,
-                    'Day': activity.day,
-                    'Time': activity.time_slot,
-                    'Activity_Type': activity.type_label,
-                    'Activity_Code': activity.type_code,
-                    'Activity_Detail': activity.description
-                })
-
-        self.processed_df = pd.DataFrame(processed_rows)
-        print(f"Processed {len(processed_rows)} activity records")
+        # Parse every cell at once: "X: description" -> code X + description.
+        # Non-string cells become <NA> and drop out with unknown codes.
+        activity = self.raw_data['Activity'].astype(STRING_DTYPE).str.strip()
+        first_char = activity.str[0].fillna('').to_numpy(dtype='U1').view(np.uint32)
+        type_index = _TYPE_LOOKUP[np.minimum(first_char, len(_TYPE_LOOKUP) - 1)]
+        mask = type_index >= 0
+        type_codes = type_index[mask]
+
+        valid = self.raw_data[mask]
+
+        # Time slots keep their sheet order (the day runs past midnight, so
+        # "00:00" sorts after "23:30") and group on small integer codes.
+        # Factorize before masking so a slot left blank on the first day
+        # still gets its position from the sheet, not from its first entry.
+        time_codes, time_slots = pd.factorize(self.raw_data['Time'].astype(str))
+        time_codes = time_codes[mask]
+
+        self.processed_df = pd.DataFrame({
+            'Year': valid['Year'],
+            'Month': valid['Month'],
+            'Week': valid['Week'],
+            'Day': valid['Day'],
+            'Time': pd.Categorical.from_codes(
+                time_codes, categories=time_slots, ordered=True
+            ),
+            'Activity_Type': pd.Categorical.from_codes(
+                type_codes, dtype=PROCESSED_DTYPES['Activity_Type']
+            ),
+            'Activity_Code': pd.Categorical.from_codes(
+                type_codes, dtype=PROCESSED_DTYPES['Activity_Code']
+            ),
+            'Activity_Detail': activity[mask].str[2:].str.strip()
+        }, columns=PROCESSED_COLUMNS).astype(PROCESSED_DTYPES).reset_index(drop=True)
+        self.activities = []
+        logger.info("Processed %d activity records", len(self.processed_df))
 
         return self.processed_df
 
     def get_activities(self) -> List[Activity]:
         """Get list of all processed Activity objects."""
-        if not self.activities:
+        if self.processed_df is None:
             self.process()
+        if not self.activities:
+            self.activities = [
+                Activity(
+                    time_slot=row.Time,
+                    day=row.Day,
+                    activity_type=ActivityType.from_code(row.Activity_Code),
+                    description=row.Activity_Detail,
+                    month=int(row.Month),
+                    week=int(row.Week),
+                    year=int(row.Year)
+                )
+                for row in self.processed_df.itertuples(index=False)
+            ]
         return self.activities
 
     def get_dataframe(self) -> pd.DataFrame:
@@ -20,21 +20,24 @@ class ActivityType(Enum):
     @classmethod
     def from_code(cls, code: str) -> Optional['ActivityType']:
         """Get ActivityType from code letter."""
-        code = code.upper()
-        for activity_type in cls:
-            if activity_type.code == code:
-                return activity_type
-        return None
+        return _TYPES_BY_CODE.get(code.upper() if code else '')
 
     @classmethod
     def get_all_labels(cls) -> dict:
         """Get mapping of codes to labels."""
-        return {at.code: at.label for at in cls}
+        return dict(_LABELS_BY_CODE)
+
+
+# Lookup tables built once; the enum is fixed at import time
+_TYPES_BY_CODE = {at.code: at for at in ActivityType}
+_LABELS_BY_CODE = {at.code: at.label for at in ActivityType}
 
 
 @dataclass
 class Activity:
     """Represents a single time tracking activity."""
+    __slots__ = ('time_slot', 'day', 'activity_type', 'description', 'month', 'week', 'year')
+
     time_slot: str
     day: str
     activity_type: ActivityType
@@ -9,6 +9,8 @@ import calendar
 @dataclass
 class TimePeriod:
     """Base class for time periods."""
+    __slots__ = ('year',)
+
     year: int
 
     def matches(self, activity_year: int, activity_month: int, activity_week: int) -> bool:
@@ -19,6 +21,8 @@ class TimePeriod:
 @dataclass
 class Week(TimePeriod):
     """Represents a specific week in a specific month and year."""
+    __slots__ = ('month', 'week')
+
     month: int
     week: int
 
@@ -41,6 +45,8 @@ class Week(TimePeriod):
 @dataclass
 class Month(TimePeriod):
     """Represents a specific month in a year."""
+    __slots__ = ('month',)
+
     month: int
 
     def matches(self, activity_year: int, activity_month: int, activity_week: int) -> bool:
@@ -60,6 +66,7 @@ class Month(TimePeriod):
 @dataclass
 class Year(TimePeriod):
     """Represents a specific year."""
+    __slots__ = ()
 
     def matches(self, activity_year: int, activity_month: int, activity_week: int) -> bool:
         """Check if activity is in this specific year."""
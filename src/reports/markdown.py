@@ -1,8 +1,9 @@
 """Generate detailed markdown reports for LLM analysis."""
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from pathlib import Path
 from datetime import datetime
+import heapq
 import json
 
 
@@ -19,6 +20,50 @@ class MarkdownReportGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _emit_table(self, report_lines: List[str], header: str, separator: str,
+                    rows: Iterable[str]):
+        """
+        Append a markdown table to the report.
+
+        The body rows are joined and appended as a single block rather than
+        one list entry per row.
+
+        Args:
+            report_lines: Report being built
+            header: Table header row
+            separator: Header separator row
+            rows: Formatted table rows
+        """
+        report_lines.append(header)
+        report_lines.append(separator)
+        body = '\n'.join(rows)
+        if body:
+            report_lines.append(body)
+
+    def _write_report(self, filename: str, report_lines: List[str]) -> Path:
+        """
+        Write report lines to a file in the output directory.
+
+        Lines are streamed through a large write buffer instead of being
+        joined into one string first.
+
+        Args:
+            filename: Output filename
+            report_lines: Report lines, written newline-separated
+
+        Returns:
+            Path to the written report
+        """
+        report_path = self.output_dir / filename
+        with report_path.open('w', encoding='utf-8', buffering=1 << 20) as f:
+            lines = iter(report_lines)
+            f.write(next(lines, ''))
+            for line in lines:
+                f.write('\n')
+                f.write(line)
+
+        return report_path
+
     def generate_period_report(self, analysis: Dict, filename: str = "report.md") -> str:
         """
         Generate a detailed markdown report for a time period analysis.
@@ -39,8 +84,7 @@ class MarkdownReportGenerator:
         # Check for errors
         if 'error' in analysis:
             report_lines.append(f"## ⚠️ Error\n\n{analysis['error']}\n")
-            report_path = self.output_dir / filename
-            report_path.write_text('\n'.join(report_lines), encoding='utf-8')
+            report_path = self._write_report(filename, report_lines)
             return str(report_path)
 
         # Executive Summary
@@ -60,9 +104,6 @@ class MarkdownReportGenerator:
         report_lines.append("## 🎯 Activity Type Distribution\n")
 
         if analysis.get('activity_breakdown'):
-            report_lines.append("| Activity Type | Hours | Blocks | Percentage |")
-            report_lines.append("|--------------|-------|--------|------------|")
-
             # Sort by hours descending
             sorted_activities = sorted(
                 analysis['activity_breakdown'].items(),
@@ -70,10 +111,13 @@ class MarkdownReportGenerator:
                 reverse=True
             )
 
-            for activity_type, stats in sorted_activities:
-                report_lines.append(
-                    f"| {activity_type} | {stats['hours']} | {stats['blocks']} | {stats['percentage']}% |"
-                )
+            self._emit_table(
+                report_lines,
+                "| Activity Type | Hours | Blocks | Percentage |",
+                "|--------------|-------|--------|------------|",
+                (f"| {activity_type} | {stats['hours']} | {stats['blocks']} | {stats['percentage']}% |"
+                 for activity_type, stats in sorted_activities)
+            )
 
             report_lines.append("")
 
@@ -103,14 +147,14 @@ class MarkdownReportGenerator:
         # Top Activities
         if analysis.get('top_activities'):
             report_lines.append("## ⭐ Top 10 Specific Activities\n")
-            report_lines.append("| Rank | Activity | Type | Hours |")
-            report_lines.append("|------|----------|------|-------|")
-
-            for i, activity in enumerate(analysis['top_activities'], 1):
-                activity_name = activity['activity'][:50]  # Truncate long names
-                report_lines.append(
-                    f"| {i} | {activity_name} | {activity['type']} | {activity['hours']} |"
-                )
+            self._emit_table(
+                report_lines,
+                "| Rank | Activity | Type | Hours |",
+                "|------|----------|------|-------|",
+                # Activity names are truncated to 50 characters
+                (f"| {i} | {activity['activity'][:50]} | {activity['type']} | {activity['hours']} |"
+                 for i, activity in enumerate(analysis['top_activities'], 1))
+            )
 
             report_lines.append("")
 
@@ -119,25 +163,26 @@ class MarkdownReportGenerator:
             report_lines.append("## ⏰ Time Slot Patterns\n")
             report_lines.append("*Most active time periods:*\n")
 
-            # Calculate total activity per time slot
-            time_totals = {}
-            for time_slot, activities in analysis['time_slot_patterns'].items():
-                time_totals[time_slot] = sum(activities.values())
-
-            # Get top 10 most active time slots
-            top_times = sorted(time_totals.items(), key=lambda x: x[1], reverse=True)[:10]
-
-            report_lines.append("| Time | Activity Count | Breakdown |")
-            report_lines.append("|------|---------------|-----------|")
-
-            for time_slot, total in top_times:
-                breakdown_parts = []
-                if time_slot in analysis['time_slot_patterns']:
-                    for activity_type, count in analysis['time_slot_patterns'][time_slot].items():
-                        breakdown_parts.append(f"{activity_type}: {count}")
+            # Get top 10 most active time slots (heapq.nlargest keeps the
+            # same tie order as a stable descending sort, without sorting all)
+            top_times = heapq.nlargest(
+                10,
+                ((time_slot, sum(activities.values()))
+                 for time_slot, activities in analysis['time_slot_patterns'].items()),
+                key=lambda x: x[1]
+            )
 
-                breakdown = ", ".join(breakdown_parts)
-                report_lines.append(f"| {time_slot} | {total} | {breakdown} |")
+            patterns = analysis['time_slot_patterns']
+            self._emit_table(
+                report_lines,
+                "| Time | Activity Count | Breakdown |",
+                "|------|---------------|-----------|",
+                (f"| {time_slot} | {total} | "
+                 + ", ".join(f"{activity_type}: {count}"
+                             for activity_type, count in patterns[time_slot].items())
+                 + " |"
+                 for time_slot, total in top_times)
+            )
 
             report_lines.append("")
 
@@ -166,8 +211,7 @@ class MarkdownReportGenerator:
         report_lines.append("5. **Recommendations:** What specific, actionable changes could improve well-being?")
 
         # Save report
-        report_path = self.output_dir / filename
-        report_path.write_text('\n'.join(report_lines), encoding='utf-8')
+        report_path = self._write_report(filename, report_lines)
         print(f"Generated report: {report_path}")
 
         return str(report_path)
@@ -194,24 +238,31 @@ class MarkdownReportGenerator:
 
         report_lines.append(f"## 📊 Comparing {len(periods)} Periods\n")
 
+        # Only periods that were analyzed without errors are reported
+        valid_analyses = [
+            comparisons[period] for period in periods
+            if period in comparisons and 'error' not in comparisons[period]
+        ]
+
         # Overview table
-        report_lines.append("| Period | Total Hours | Top Activity |")
-        report_lines.append("|--------|-------------|--------------|")
-
-        for period in periods:
-            if period in comparisons:
-                analysis = comparisons[period]
-                if 'error' not in analysis:
-                    top_activity = "N/A"
-                    if analysis.get('activity_breakdown'):
-                        top_activity = max(
-                            analysis['activity_breakdown'].items(),
-                            key=lambda x: x[1]['hours']
-                        )[0]
-
-                    report_lines.append(
-                        f"| {analysis['period_label']} | {analysis['total_hours']} | {top_activity} |"
-                    )
+        overview_rows = []
+        for analysis in valid_analyses:
+            top_activity = "N/A"
+            if analysis.get('activity_breakdown'):
+                top_activity = max(
+                    analysis['activity_breakdown'].items(),
+                    key=lambda x: x[1]['hours']
+                )[0]
+            overview_rows.append(
+                f"| {analysis['period_label']} | {analysis['total_hours']} | {top_activity} |"
+            )
+
+        self._emit_table(
+            report_lines,
+            "| Period | Total Hours | Top Activity |",
+            "|--------|-------------|--------------|",
+            overview_rows
+        )
 
         report_lines.append("")
 
@@ -226,21 +277,22 @@ class MarkdownReportGenerator:
 
         for activity_type in sorted(all_activity_types):
             report_lines.append(f"### {activity_type}\n")
-            report_lines.append("| Period | Hours | Percentage |")
-            report_lines.append("|--------|-------|------------|")
-
-            for period in periods:
-                if period in comparisons:
-                    analysis = comparisons[period]
-                    if 'error' not in analysis:
-                        breakdown = analysis.get('activity_breakdown', {})
-                        if activity_type in breakdown:
-                            stats = breakdown[activity_type]
-                            report_lines.append(
-                                f"| {analysis['period_label']} | {stats['hours']} | {stats['percentage']}% |"
-                            )
-                        else:
-                            report_lines.append(f"| {analysis['period_label']} | 0 | 0% |")
+            trend_rows = []
+            for analysis in valid_analyses:
+                stats = analysis.get('activity_breakdown', {}).get(activity_type)
+                if stats is not None:
+                    trend_rows.append(
+                        f"| {analysis['period_label']} | {stats['hours']} | {stats['percentage']}% |"
+                    )
+                else:
+                    trend_rows.append(f"| {analysis['period_label']} | 0 | 0% |")
+
+            self._emit_table(
+                report_lines,
+                "| Period | Hours | Percentage |",
+                "|--------|-------|------------|",
+                trend_rows
+            )
 
             report_lines.append("")
 
@@ -259,8 +311,7 @@ class MarkdownReportGenerator:
         report_lines.append("4. **Progress:** Is there movement toward stated goals?")
 
         # Save report
-        report_path = self.output_dir / filename
-        report_path.write_text('\n'.join(report_lines), encoding='utf-8')
+        report_path = self._write_report(filename, report_lines)
         print(f"Generated comparison report: {report_path}")
 
         return str(report_path)
@@ -294,9 +345,6 @@ class MarkdownReportGenerator:
 
         # Activity totals
         report_lines.append("## 🎯 Total Hours by Activity Type\n")
-        report_lines.append("| Activity Type | Total Hours | Total Blocks |")
-        report_lines.append("|--------------|-------------|--------------|")
-
         activity_totals = summary_stats.get('activity_totals', {})
         sorted_activities = sorted(
             activity_totals.items(),
@@ -304,16 +352,18 @@ class MarkdownReportGenerator:
             reverse=True
         )
 
-        for activity_type, stats in sorted_activities:
-            report_lines.append(
-                f"| {activity_type} | {stats['hours']} | {stats['blocks']} |"
-            )
+        self._emit_table(
+            report_lines,
+            "| Activity Type | Total Hours | Total Blocks |",
+            "|--------------|-------------|--------------|",
+            (f"| {activity_type} | {stats['hours']} | {stats['blocks']} |"
+             for activity_type, stats in sorted_activities)
+        )
 
         report_lines.append("")
 
         # Save report
-        report_path = self.output_dir / filename
-        report_path.write_text('\n'.join(report_lines), encoding='utf-8')
+        report_path = self._write_report(filename, report_lines)
         print(f"Generated summary report: {report_path}")
 
         return str(report_path)
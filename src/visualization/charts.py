@@ -27,6 +27,29 @@ class ChartGenerator:
             data: Processed DataFrame with activity data
         """
         self.data = data
+        self._counts_source = None
+        self._counts = None
+
+    def _block_counts(self, period_data: pd.DataFrame) -> pd.Series:
+        """
+        Count blocks by Day, Time and Activity_Type in one pass.
+
+        The per-chart aggregations are level sums over this series. It is
+        cached for the most recent frame, so the charts generated for one
+        period share a single groupby over the rows.
+
+        Args:
+            period_data: Filtered data for specific period
+
+        Returns:
+            Series of block counts indexed by (Day, Time, Activity_Type)
+        """
+        if self._counts_source is not period_data:
+            self._counts = period_data.groupby(
+                ['Day', 'Time', 'Activity_Type'], observed=True
+            ).size()
+            self._counts_source = period_data
+        return self._counts
 
     def create_period_distribution(self, period_data: pd.DataFrame,
                                    title: str, period_type: str = 'Week') -> go.Figure:
@@ -42,7 +65,9 @@ class ChartGenerator:
             Plotly Figure object
         """
         # Calculate hours by activity type
-        activity_counts = period_data.groupby('Activity_Type').size()
+        activity_counts = self._block_counts(period_data).groupby(
+            level='Activity_Type', observed=True
+        ).sum()
         activity_hours = activity_counts * 0.5
 
         # Create stacked bar chart
@@ -54,7 +79,7 @@ class ChartGenerator:
                 x=[title],
                 y=[activity_hours[activity_type]],
                 marker_color=self.ACTIVITY_COLORS.get(activity_type, '#CCCCCC'),
-                text=f"{activity_hours[activity_type]:.1f}h",
+                texttemplate='%{y:.1f}h',
                 textposition='inside'
             ))
 
@@ -82,13 +107,12 @@ class ChartGenerator:
             Plotly Figure object
         """
         # Group by day and activity type
-        daily_counts = period_data.groupby(['Day', 'Activity_Type']).size().unstack(fill_value=0)
+        daily_counts = self._block_counts(period_data).groupby(
+            level=['Day', 'Activity_Type'], observed=True
+        ).sum().unstack(fill_value=0)
+        # Day is an ordered categorical, so rows already come out Sunday first
         daily_hours = daily_counts * 0.5
 
-        # Reorder days
-        day_order = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        daily_hours = daily_hours.reindex([d for d in day_order if d in daily_hours.index])
-
         fig = go.Figure()
 
         for activity_type in daily_hours.columns:
@@ -97,7 +121,7 @@ class ChartGenerator:
                 x=daily_hours.index,
                 y=daily_hours[activity_type],
                 marker_color=self.ACTIVITY_COLORS.get(activity_type, '#CCCCCC'),
-                text=daily_hours[activity_type].round(1),
+                texttemplate='%{y:.1f}',
                 textposition='auto'
             ))
 
@@ -124,7 +148,9 @@ class ChartGenerator:
         Returns:
             Plotly Figure object
         """
-        activity_counts = period_data['Activity_Type'].value_counts()
+        activity_counts = self._block_counts(period_data).groupby(
+            level='Activity_Type', observed=True
+        ).sum().sort_values(ascending=False, kind='stable')
         activity_hours = activity_counts * 0.5
 
         colors = [self.ACTIVITY_COLORS.get(at, '#CCCCCC') for at in activity_hours.index]
@@ -156,14 +182,11 @@ class ChartGenerator:
         Returns:
             Plotly Figure object
         """
-        # Create pivot table with time slots and days
-        day_order = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-
-        # Count activities by time and day
-        heatmap_data = period_data.groupby(['Time', 'Day']).size().unstack(fill_value=0)
-
-        # Reorder columns
-        heatmap_data = heatmap_data.reindex(columns=[d for d in day_order if d in heatmap_data.columns])
+        # Count activities by time and day; Time and Day are ordered
+        # categoricals, so rows and columns are already in display order
+        heatmap_data = self._block_counts(period_data).groupby(
+            level=['Time', 'Day'], observed=True
+        ).sum().unstack(fill_value=0)
 
         fig = go.Figure(data=go.Heatmap(
             z=heatmap_data.values,
@@ -193,22 +216,26 @@ class ChartGenerator:
         Returns:
             Plotly Figure object
         """
+        # Hours per activity type (rows) and period (columns), one groupby per period
+        activity_counts = pd.concat(
+            {
+                period_label: period_data.groupby('Activity_Type', observed=True).size()
+                for period_label, period_data in periods_data.items()
+            },
+            axis=1
+        ).fillna(0)
+        activity_hours = activity_counts * 0.5
+
+        # One trace per activity type spanning all periods
         fig = go.Figure()
 
-        # Calculate hours for each period and activity type
-        for period_label, period_data in periods_data.items():
-            activity_counts = period_data.groupby('Activity_Type').size()
-            activity_hours = activity_counts * 0.5
-
-            for activity_type in activity_hours.index:
-                fig.add_trace(go.Bar(
-                    name=activity_type,
-                    x=[period_label],
-                    y=[activity_hours[activity_type]],
-                    marker_color=self.ACTIVITY_COLORS.get(activity_type, '#CCCCCC'),
-                    legendgroup=activity_type,
-                    showlegend=period_label == list(periods_data.keys())[0]
-                ))
+        for activity_type in activity_hours.index:
+            fig.add_trace(go.Bar(
+                name=activity_type,
+                x=list(activity_hours.columns),
+                y=activity_hours.loc[activity_type].to_numpy(),
+                marker_color=self.ACTIVITY_COLORS.get(activity_type, '#CCCCCC')
+            ))
 
         fig.update_layout(
             title='Period Comparison',
@@ -277,17 +304,20 @@ class ChartGenerator:
             )
             return fig
 
-        activities = [f"{a['activity'][:30]}..." if len(a['activity']) > 30 else a['activity']
-                     for a in top_activities]
-        hours = [a['hours'] for a in top_activities]
-        colors = [self.ACTIVITY_COLORS.get(a['type'], '#CCCCCC') for a in top_activities]
+        # Single pass, filled bottom-to-top so the largest bar is drawn first
+        activities, hours, colors = [], [], []
+        for a in reversed(top_activities):
+            name = a['activity']
+            activities.append(f"{name[:30]}..." if len(name) > 30 else name)
+            hours.append(a['hours'])
+            colors.append(self.ACTIVITY_COLORS.get(a['type'], '#CCCCCC'))
 
         fig = go.Figure(data=[go.Bar(
-            y=activities[::-1],  # Reverse for top-to-bottom display
-            x=hours[::-1],
+            y=activities,
+            x=hours,
             orientation='h',
-            marker=dict(color=colors[::-1]),
-            text=[f"{h:.1f}h" for h in hours[::-1]],
+            marker=dict(color=colors),
+            texttemplate='%{x:.1f}h',
             textposition='auto'
         )])
 
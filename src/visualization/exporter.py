@@ -1,12 +1,96 @@
 """Export visualizations to various formats."""
 
 import plotly.graph_objects as go
+import plotly.io as pio
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict
 import json
+import logging
+import os
 import numpy as np
 
 
+logger = logging.getLogger(__name__)
+
+# Static parts of the report index page; only the list entries vary
+_INDEX_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Time Analysis Reports</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+            max-width: 800px;
+            margin: 50px auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #AA96DA;
+            padding-bottom: 10px;
+        }
+        ul {
+            list-style: none;
+            padding: 0;
+        }
+        li {
+            background: white;
+            margin: 10px 0;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        a {
+            color: #AA96DA;
+            text-decoration: none;
+            font-size: 18px;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+    </style>
+</head>
+<body>
+    <h1>Time Analysis Reports</h1>
+    <ul>
+"""
+
+_INDEX_TAIL = """
+    </ul>
+</body>
+</html>
+"""
+
+
+def _to_native(obj):
+    """Recursively convert numpy values in JSON-bound data to native Python types."""
+    if isinstance(obj, dict):
+        return {key: _to_native(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_native(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+@lru_cache(maxsize=1024)
+def _display_name(report_file: str) -> str:
+    """Turn a report filename like 'week_2023_1_1.html' into an index link label."""
+    return report_file.removesuffix(".html").replace("_", " ").title()
+
+
+def _write_image_from_json(fig_json: str, output_path: str, format: str,
+                           width: int, height: int):
+    """Render a figure serialized with to_json() to an image (process pool worker)."""
+    pio.from_json(fig_json).write_image(output_path, width=width, height=height, format=format)
+
+
 class VisualizationExporter:
     """Export charts and visualizations to files."""
 
@@ -20,20 +104,31 @@ class VisualizationExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def export_html(self, fig: go.Figure, filename: str):
+        # Static image export needs kaleido; check once instead of failing per figure
+        try:
+            import kaleido  # noqa: F401
+            self._has_kaleido = True
+        except ImportError:
+            self._has_kaleido = False
+
+    def export_html(self, fig: go.Figure, filename: str, validate: bool = True):
         """
         Export figure as interactive HTML.
 
+        plotly.js is loaded from the CDN rather than embedded, which keeps
+        each file at tens of KB instead of several MB.
+
         Args:
             fig: Plotly Figure object
             filename: Output filename (without extension)
+            validate: Whether plotly re-validates the figure before writing
         """
         output_path = self.output_dir / f"{filename}.html"
-        fig.write_html(str(output_path))
-        print(f"Exported HTML: {output_path}")
+        fig.write_html(str(output_path), include_plotlyjs='cdn', validate=validate)
+        logger.info("Exported HTML: %s", output_path)
 
     def export_image(self, fig: go.Figure, filename: str, format: str = 'png',
-                    width: int = 1200, height: int = 800):
+                    width: int = 1200, height: int = 800, validate: bool = True):
         """
         Export figure as static image.
 
@@ -43,17 +138,81 @@ class VisualizationExporter:
             format: Image format ('png', 'jpg', 'svg', 'pdf')
             width: Image width in pixels
             height: Image height in pixels
+            validate: Whether plotly re-validates the figure before writing
 
-        Note: Requires kaleido package
+        Note: Requires kaleido package; falls back to HTML without it
         """
+        if not self._has_kaleido:
+            logger.warning("Could not export image (install kaleido: pip install kaleido)")
+            return self.export_html(fig, filename, validate=validate)
+
         try:
             output_path = self.output_dir / f"{filename}.{format}"
-            fig.write_image(str(output_path), width=width, height=height, format=format)
-            print(f"Exported {format.upper()}: {output_path}")
-        except Exception as e:
-            print(f"Warning: Could not export image (install kaleido: pip install kaleido): {e}")
+            fig.write_image(str(output_path), width=width, height=height, format=format,
+                            validate=validate)
+            logger.info("Exported %s: %s", format.upper(), output_path)
+        except (ValueError, RuntimeError) as e:
+            logger.warning("Could not export image (install kaleido: pip install kaleido): %s", e)
             # Fallback to HTML if image export fails
-            self.export_html(fig, filename)
+            self.export_html(fig, filename, validate=validate)
+
+    def export_images(self, figures: Dict[str, go.Figure], format: str = 'png',
+                      width: int = 1200, height: int = 800):
+        """
+        Export several figures as static images in one batch.
+
+        With kaleido >= 1.0 (plotly >= 6.1) all figures are rendered in a
+        single export session instead of starting the engine per figure;
+        otherwise the figures are rendered in parallel worker processes.
+
+        Args:
+            figures: Dictionary of {filename (without extension): figure}
+            format: Image format ('png', 'jpg', 'svg', 'pdf')
+            width: Image width in pixels
+            height: Image height in pixels
+        """
+        if not figures:
+            return
+
+        if not self._has_kaleido or len(figures) == 1:
+            for filename, fig in figures.items():
+                self.export_image(fig, filename, format=format, width=width, height=height)
+            return
+
+        write_images = getattr(pio, 'write_images', None)
+        if write_images is not None:
+            output_paths = [self.output_dir / f"{filename}.{format}" for filename in figures]
+            try:
+                write_images(list(figures.values()), output_paths,
+                             format=format, width=width, height=height)
+            except (ValueError, RuntimeError) as e:
+                # e.g. kaleido older than 1.0; render in worker processes below
+                logger.debug("Batch image export failed, falling back to worker processes: %s", e)
+            else:
+                for output_path in output_paths:
+                    logger.info("Exported %s: %s", format.upper(), output_path)
+                return
+
+        # Figures cross the process boundary as JSON, which is cheaper to
+        # pickle than the figure objects themselves
+        max_workers = min(len(figures), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                filename: executor.submit(
+                    _write_image_from_json, fig.to_json(),
+                    str(self.output_dir / f"{filename}.{format}"), format, width, height
+                )
+                for filename, fig in figures.items()
+            }
+
+        for filename, future in futures.items():
+            try:
+                future.result()
+                logger.info("Exported %s: %s", format.upper(), self.output_dir / f"{filename}.{format}")
+            except (ValueError, RuntimeError) as e:
+                logger.warning("Could not export image (install kaleido: pip install kaleido): %s", e)
+                # Fallback to HTML if image export fails
+                self.export_html(figures[filename], filename)
 
     def export_data(self, data: Dict, filename: str):
         """
@@ -63,38 +222,36 @@ class VisualizationExporter:
             data: Dictionary with analysis data
             filename: Output filename (without extension)
         """
-        def convert_numpy(obj):
-            """Convert numpy types to native Python types."""
-            if isinstance(obj, (np.integer, np.int64)):
-                return int(obj)
-            elif isinstance(obj, (np.floating, np.float64)):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return obj
-
+        # Convert numpy values in one walk up front, then encode the whole
+        # document at once rather than streaming many small writes
         output_path = self.output_dir / f"{filename}.json"
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=convert_numpy)
-        print(f"Exported JSON: {output_path}")
+            f.write(json.dumps(_to_native(data), indent=2, ensure_ascii=False))
+        logger.info("Exported JSON: %s", output_path)
 
     def export_all_formats(self, fig: go.Figure, filename: str,
                           export_html: bool = True,
-                          export_png: bool = True):
+                          export_png: bool = True,
+                          validate: bool = False):
         """
         Export figure in multiple formats.
 
+        Figures built through plotly.graph_objects are validated as they are
+        constructed, so re-validating them for each writer is skipped by
+        default.
+
         Args:
             fig: Plotly Figure object
             filename: Output filename (without extension)
             export_html: Whether to export HTML
             export_png: Whether to export PNG
+            validate: Whether plotly re-validates the figure before each write
         """
         if export_html:
-            self.export_html(fig, filename)
+            self.export_html(fig, filename, validate=validate)
 
         if export_png:
-            self.export_image(fig, filename, format='png')
+            self.export_image(fig, filename, format='png', validate=validate)
 
     def create_index_html(self, report_files: List[str]):
         """
@@ -103,60 +260,13 @@ class VisualizationExporter:
         Args:
             report_files: List of HTML filenames
         """
-        html_content = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Time Analysis Reports</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-        h1 {
-            color: #333;
-            border-bottom: 3px solid #AA96DA;
-            padding-bottom: 10px;
-        }
-        ul {
-            list-style: none;
-            padding: 0;
-        }
-        li {
-            background: white;
-            margin: 10px 0;
-            padding: 15px;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }
-        a {
-            color: #AA96DA;
-            text-decoration: none;
-            font-size: 18px;
-        }
-        a:hover {
-            text-decoration: underline;
-        }
-    </style>
-</head>
-<body>
-    <h1>Time Analysis Reports</h1>
-    <ul>
-"""
-
-        for report_file in report_files:
-            report_name = report_file.replace('.html', '').replace('_', ' ').title()
-            html_content += f'        <li><a href="{report_file}">{report_name}</a></li>\n'
-
-        html_content += """
-    </ul>
-</body>
-</html>
-"""
+        entries = (
+            f'        <li><a href="{report_file}">'
+            f'{_display_name(report_file)}</a></li>\n'
+            for report_file in report_files
+        )
+        html_content = _INDEX_HEAD + "".join(entries) + _INDEX_TAIL
 
         index_path = self.output_dir / "index.html"
         index_path.write_text(html_content)
-        print(f"Created index: {index_path}")
+        logger.info("Created index: %s", index_path)
@@ -0,0 +1,34 @@
+"""Tests for the data processor."""
+
+import unittest
+
+import pandas as pd
+
+from src.data.loader import DAY_DTYPE
+from src.data.processor import DataProcessor
+
+
+class TestDataProcessor(unittest.TestCase):
+    """Tests for DataProcessor.process()."""
+
+    def test_time_order_follows_sheet_when_first_slot_is_blank(self):
+        times = ['08:00', '08:30', '23:30', '00:00']
+        raw_data = pd.DataFrame({
+            'Time': times * 2,
+            'Day': pd.Categorical(['Sunday'] * 4 + ['Monday'] * 4, dtype=DAY_DTYPE),
+            # Sunday 08:00 is blank, so 08:00 first has an activity on Monday
+            'Activity': ['', 'R sleep', 'W work', 'R sleep',
+                         'W work', 'W work', 'G game', 'R sleep'],
+            'Month': 1,
+            'Week': 1,
+            'Year': 2023,
+        })
+
+        processed = DataProcessor(raw_data).process()
+
+        self.assertEqual(list(processed['Time'].cat.categories), times)
+        self.assertEqual(len(processed), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Tests for the legacy time_analysis script."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from time_analysis import _write_csv
+
+
+class TestWriteCsv(unittest.TestCase):
+    """Tests for _write_csv()."""
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'Activity_Type': ['Work', 'Rest', 'Work'],
+            'Activity_Detail': ['Ritual/Solar', 'read, walk', 'say "hi"'],
+            'Hours': [2.0, 0.5, 1.0],
+            'Count': [4, 1, 2],
+        })
+
+    def _written(self, df):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'stats.csv'
+            _write_csv(df, path)
+            return path.read_text()
+
+    def test_matches_to_csv(self):
+        self.assertEqual(self._written(self.df), self.df.to_csv(index=False))
+
+    def test_matches_to_csv_across_chunks(self):
+        with mock.patch('time_analysis.CSV_CHUNK_ROWS', 2):
+            written = self._written(self.df)
+        self.assertEqual(written, self.df.to_csv(index=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
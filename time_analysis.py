@@ -4,14 +4,71 @@ import plotly.graph_objects as go
 from pathlib import Path
 import numpy as np
 import argparse
+import json
+import logging
+import re
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+from packaging.version import Version
 
-# Suppress openpyxl warnings
-warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+logger = logging.getLogger(__name__)
+
+# Use the Rust-based calamine reader for the workbook when it is installed
+# and pandas supports it (>= 2.2); otherwise let pandas pick its default
+# (openpyxl)
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine' if Version(pd.__version__) >= Version('2.2') else None
+except ImportError:
+    EXCEL_ENGINE = None
+if EXCEL_ENGINE is None:
+    # openpyxl warns about workbook features it does not read (styles,
+    # data validation); calamine never does, so only silence it here
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+DAY_ORDER = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+# Week sheets are named "month.week", e.g. "1.2"; template sheets are skipped
+_SHEET_NAME_RE = re.compile(r'(\d+)\.(\d+)')
+_SKIPPED_SHEETS = frozenset({'sample'})
+
+# Rows per chunk when writing detailed statistics, to bound peak memory
+CSV_CHUNK_ROWS = 50_000
+
+# orjson (Rust) serializes the summary JSON much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _write_csv(df, path):
+    """Write a DataFrame to CSV without its index, in chunks of CSV_CHUNK_ROWS"""
+    df.to_csv(path, index=False, chunksize=CSV_CHUNK_ROWS)
+
+
+def _write_json(data, path):
+    """Write data as indented JSON, via orjson when installed"""
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 class TimeAnalyzer:
+    HOURS_PER_BLOCK = 0.5  # Each time block is 30 minutes
+    
+    # cached_property aggregates derived from processed_data
+    _CACHED_AGGREGATES = (
+        'activity_hours', '_type_blocks', '_base_counts', '_monthly_hours', '_daily_hours', '_weekly_hours',
+        '_activity_stats',
+    )
+
     def __init__(self, excel_path, year=2024):
         self.excel_path = excel_path
         self.year = year
@@ -27,68 +84,83 @@ class TimeAnalyzer:
     
     def parse_sheet_name(self, sheet_name):
         """Convert sheet name (x.y) to month and week number"""
-        print(f"Parsing sheet name: {sheet_name} (type: {type(sheet_name)})")
+        logger.debug("Parsing sheet name: %r (type: %s)", sheet_name, type(sheet_name).__name__)
         
         if isinstance(sheet_name, float):
             sheet_name = str(int(sheet_name))
-        if sheet_name.lower() == 'sample':
+        sheet_name = sheet_name.strip()
+        if sheet_name.lower() in _SKIPPED_SHEETS:
             return None, None
-            
-        month, week = map(int, sheet_name.split('.'))
-        print(f"Parsed month: {month}, week: {week}")
+        
+        match = _SHEET_NAME_RE.fullmatch(sheet_name)
+        if match is None:
+            raise ValueError(f"expected a 'month.week' sheet name, got {sheet_name!r}")
+        month, week = int(match[1]), int(match[2])
+        logger.debug("Parsed month: %d, week: %d", month, week)
         return month, week
     
+    def _parse_one_sheet(self, excel_file, sheet_name):
+        """Read one week sheet from an open workbook as (time slots, activities per slot and day) arrays"""
+        # Read the sheet, skipping the first row and using second row as header
+        df = excel_file.parse(
+            sheet_name,
+            skiprows=1,  # Skip the first row (SAMPLE)
+            usecols="A:H"  # Only use columns A through H
+        )
+        # Rename columns to standard format
+        df.columns = ['Time'] + DAY_ORDER
+        return df['Time'].to_numpy(), df[DAY_ORDER].to_numpy()
+    
     def load_data(self):
         """Load all sheets from the Excel file and combine them"""
-        print(f"\nLoading Excel file: {self.excel_path}")
-        excel_file = pd.ExcelFile(self.excel_path)
-        print(f"Found sheets: {excel_file.sheet_names}")
-        
-        all_sheets = []
-        for sheet_name in excel_file.sheet_names:
-            print(f"\nProcessing sheet: {sheet_name}")
+        logger.info("Loading Excel file: %s", self.excel_path)
+        # One open workbook is parsed sheet by sheet instead of re-reading
+        # the whole file for every sheet
+        with pd.ExcelFile(self.excel_path, engine=EXCEL_ENGINE) as excel_file:
+            logger.debug("Found sheets: %s", excel_file.sheet_names)
             
-            # Parse sheet name
-            try:
-                month, week = self.parse_sheet_name(sheet_name)
-            except Exception as e:
-                print(f"Error parsing sheet name: {str(e)}")
-                continue
+            week_sheets = []
+            for sheet_name in excel_file.sheet_names:
+                logger.debug("Processing sheet: %s", sheet_name)
                 
-            if month is None:
-                print("Skipping sheet (invalid name format)")
-                continue
-            
-            # Read the sheet, skipping the first row and using second row as header
-            df = pd.read_excel(
-                self.excel_path,
-                sheet_name=sheet_name,
-                skiprows=1,  # Skip the first row (SAMPLE)
-                usecols="A:H"  # Only use columns A through H
-            )            
-            # Rename columns to standard format
-            weekdays = ['Time', 'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-            df.columns = weekdays            
-            # Melt the dataframe to convert days to rows
-            df_melted = df.melt(
-                id_vars=['Time'],
-                value_vars=weekdays[1:],  # All days except Time
-                var_name='Day',
-                value_name='Activity'
-            )
+                # Parse sheet name
+                try:
+                    month, week = self.parse_sheet_name(sheet_name)
+                except Exception as e:
+                    logger.warning("Error parsing sheet name %r: %s", sheet_name, e)
+                    continue
+                
+                if month is None:
+                    logger.debug("Skipping sheet %s (invalid name format)", sheet_name)
+                    continue
+                
+                week_sheets.append((sheet_name, month, week))
             
-            df_melted['Month'] = month
-            df_melted['Week'] = week
-            all_sheets.append(df_melted)
-            print(f"Successfully processed sheet {sheet_name}")
+            all_sheets = [self._parse_one_sheet(excel_file, name) for name, _, _ in week_sheets]
         
         if not all_sheets:
-            print("No valid sheets were processed!")
+            logger.error("No valid sheets were processed!")
             sys.exit(1)
         
-        self.data = pd.concat(all_sheets, ignore_index=True)
-        print(f"\nFinal combined data shape: {self.data.shape}")
-        print(f"Final columns: {self.data.columns.tolist()}")
+        # Convert days to rows (what melt does) for all sheets at once: each
+        # long column is built with a single concatenation instead of one
+        # DataFrame per sheet plus a pd.concat copy. Column-major ravel keeps
+        # all of Sunday first, then Monday, ...
+        n_days = len(DAY_ORDER)
+        day_range = np.arange(n_days, dtype=np.int8)
+        sheet_rows = [len(times) * n_days for times, _ in all_sheets]
+        self.data = pd.DataFrame({
+            'Time': np.concatenate([np.tile(times, n_days) for times, _ in all_sheets]),
+            'Day': pd.Categorical.from_codes(
+                np.concatenate([np.repeat(day_range, len(times)) for times, _ in all_sheets]),
+                categories=DAY_ORDER, ordered=True
+            ),
+            'Activity': np.concatenate([activities.ravel(order='F') for _, activities in all_sheets]),
+            'Month': np.repeat([month for _, month, _ in week_sheets], sheet_rows),
+            'Week': np.repeat([week for _, _, week in week_sheets], sheet_rows)
+        })
+        logger.info("Loaded %d sheets, combined data shape: %s", len(all_sheets), self.data.shape)
+        logger.debug("Final columns: %s", self.data.columns.tolist())
         return self
     
     def process_data(self):
@@ -96,47 +168,114 @@ class TimeAnalyzer:
         if self.data is None:
             self.load_data()
         
-        print("\nProcessing data...")
-        processed_rows = []
-        for idx, row in self.data.iterrows():          
-            activity = str(row['Activity'])
-            if pd.notna(activity) and activity.strip():
-                activity_type = activity[0].upper() if activity else ''
-                
-                if activity_type in self.activity_types:
-                    processed_rows.append({
-                        'Month': row['Month'],
-                        'Week': row['Week'],
-                        'Day': row['Day'],
-                        'Time': row['Time'],
-                        'Activity_Type': self.activity_types[activity_type],
-                        'Activity_Detail': activity[2:] if len(activity) > 2 else ''
-                    })
-        
-        self.processed_data = pd.DataFrame(processed_rows)
-        print(f"\nProcessed {len(processed_rows)} activities")
-        print(f"Processed data shape: {self.processed_data.shape}")
-        print(f"Sample of processed data:\n{self.processed_data.head()}")
+        logger.debug("Processing data...")
+        # Vectorized over the whole column: the first character selects the
+        # activity type, everything after "X " is the detail. The first
+        # characters are classified through a code point lookup table
+        # rather than per-cell string upper-casing and dict lookups.
+        lookup = np.full(128, -1, dtype=np.int8)
+        for i, code in enumerate(self.activity_types):
+            lookup[ord(code.upper())] = i
+            lookup[ord(code.lower())] = i
+        
+        activity = self.data['Activity'].astype(str)
+        first_char = activity.str[0].fillna('').to_numpy(dtype='U1').view(np.uint32)
+        type_index = lookup[np.minimum(first_char, len(lookup) - 1)]
+        mask = type_index >= 0
+        
+        # Day (already categorical from load_data) and Activity_Type are the
+        # main grouping keys, so both are categoricals: groupbys hash small
+        # integer codes instead of strings
+        self.processed_data = self.data.loc[mask, ['Month', 'Week', 'Day', 'Time']].assign(
+            Activity_Type=pd.Categorical.from_codes(
+                type_index[mask], categories=list(self.activity_types.values())
+            ),
+            Activity_Detail=activity[mask].str[2:]
+        ).reset_index(drop=True)
+        logger.info("Processed %d activities", len(self.processed_data))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample of processed data:\n%s", self.processed_data.head())
         return self
 
+    @property
+    def processed_data(self):
+        return self._processed_data
+    
+    @processed_data.setter
+    def processed_data(self, value):
+        """Replacing the processed data (e.g. filtering it) drops cached aggregates"""
+        self._processed_data = value
+        for name in self._CACHED_AGGREGATES:
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _type_blocks(self):
+        """Number of 30-min blocks per activity type, most frequent first"""
+        if self.processed_data is None:
+            self.process_data()
+        
+        # Categorical value_counts also lists types that never occur
+        blocks = self.processed_data['Activity_Type'].value_counts()
+        return blocks[blocks > 0]
+
+    @cached_property
+    def activity_hours(self):
+        """Total hours per activity type, most frequent first (computed once)"""
+        return self._type_blocks * self.HOURS_PER_BLOCK
+
+    @cached_property
+    def _base_counts(self):
+        """Blocks per month, week, day and activity type; the coarser counts are summed from it"""
+        if self.processed_data is None:
+            self.process_data()
+        
+        return self.processed_data.groupby(
+            ['Month', 'Week', 'Day', 'Activity_Type'], observed=True
+        ).size()
+
+    def _block_counts(self, *levels):
+        """Number of 30-min blocks grouped by the given levels of the base counts"""
+        return self._base_counts.groupby(level=list(levels), observed=True).sum()
+
+    def _order_activity_columns(self, hours):
+        """Keep only the activity type columns present, in activity_types order"""
+        return hours[[a for a in self.activity_types.values() if a in hours.columns]]
+
+    @cached_property
+    def _monthly_hours(self):
+        """Hours per month (rows) and activity type (columns)"""
+        monthly_counts = self._block_counts('Month', 'Activity_Type').unstack(fill_value=0)
+        return self._order_activity_columns(monthly_counts * self.HOURS_PER_BLOCK)
+
+    @cached_property
+    def _daily_hours(self):
+        """Hours per day of week (rows) and activity type (columns)"""
+        daily_counts = self._block_counts('Day', 'Activity_Type').unstack(fill_value=0)
+        # Day is an ordered categorical, so the rows already start with Sunday
+        return self._order_activity_columns(daily_counts * self.HOURS_PER_BLOCK)
+
+    @cached_property
+    def _weekly_hours(self):
+        """Hours per (month, week) (rows) and activity type (columns)"""
+        weekly_counts = self._block_counts('Month', 'Week', 'Activity_Type').unstack(fill_value=0)
+        return self._order_activity_columns(weekly_counts * self.HOURS_PER_BLOCK)
+
     def plot_monthly_distribution(self):
         """Create a stacked bar chart showing monthly time distribution"""
         if self.processed_data is None:
             self.process_data()
         
-        monthly_counts = self.processed_data.groupby(['Month', 'Activity_Type']).size().unstack(fill_value=0)
-        monthly_hours = monthly_counts * 0.5
+        monthly_hours = self._monthly_hours
         
         fig = go.Figure()
-        for activity in self.activity_types.values():
-            if activity in monthly_hours.columns:
-                fig.add_trace(go.Bar(
-                    name=activity,
-                    x=[f"Month {m}" for m in monthly_hours.index],
-                    y=monthly_hours[activity],
-                    text=monthly_hours[activity].round(1),
-                    textposition='auto',
-                ))
+        for activity in monthly_hours.columns:
+            fig.add_trace(go.Bar(
+                name=activity,
+                x=[f"Month {m}" for m in monthly_hours.index],
+                y=monthly_hours[activity],
+                texttemplate='%{y:.1f}',
+                textposition='auto',
+            ))
         
         fig.update_layout(
             title='Monthly Time Distribution',
@@ -154,23 +293,17 @@ class TimeAnalyzer:
         if self.processed_data is None:
             self.process_data()
         
-        daily_counts = self.processed_data.groupby(['Day', 'Activity_Type']).size().unstack(fill_value=0)
-        daily_hours = daily_counts * 0.5
-        
-        # Reorder days to start with Sunday
-        day_order = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        daily_hours = daily_hours.reindex(day_order)
+        daily_hours = self._daily_hours
         
         fig = go.Figure()
-        for activity in self.activity_types.values():
-            if activity in daily_hours.columns:
-                fig.add_trace(go.Bar(
-                    name=activity,
-                    x=daily_hours.index,
-                    y=daily_hours[activity],
-                    text=daily_hours[activity].round(1),
-                    textposition='auto',
-                ))
+        for activity in daily_hours.columns:
+            fig.add_trace(go.Bar(
+                name=activity,
+                x=daily_hours.index,
+                y=daily_hours[activity],
+                texttemplate='%{y:.1f}',
+                textposition='auto',
+            ))
         
         fig.update_layout(
             title='Time Distribution by Day of Week',
@@ -188,22 +321,20 @@ class TimeAnalyzer:
         if self.processed_data is None:
             self.process_data()
         
-        weekly_counts = self.processed_data.groupby(['Month', 'Week', 'Activity_Type']).size().unstack(fill_value=0)
-        weekly_hours = weekly_counts * 0.5
+        weekly_hours = self._weekly_hours
         
         # Create week labels
         week_labels = [f"M{m}W{w}" for m, w in weekly_hours.index]
         
         fig = go.Figure()
-        for activity in self.activity_types.values():
-            if activity in weekly_hours.columns:
-                fig.add_trace(go.Bar(
-                    name=activity,
-                    x=week_labels,
-                    y=weekly_hours[activity],
-                    text=weekly_hours[activity].round(1),
-                    textposition='auto',
-                ))
+        for activity in weekly_hours.columns:
+            fig.add_trace(go.Bar(
+                name=activity,
+                x=week_labels,
+                y=weekly_hours[activity],
+                texttemplate='%{y:.1f}',
+                textposition='auto',
+            ))
         
         fig.update_layout(
             title='Weekly Time Distribution',
@@ -221,8 +352,7 @@ class TimeAnalyzer:
         if self.processed_data is None:
             self.process_data()
         
-        activity_counts = self.processed_data['Activity_Type'].value_counts()
-        activity_hours = activity_counts * 0.5
+        activity_hours = self.activity_hours
         
         fig = px.pie(
             values=activity_hours.values,
@@ -234,42 +364,56 @@ class TimeAnalyzer:
         return fig
     
     def get_activity_stats(self):
-        """Generate summary statistics for activities"""
+        """Generate summary statistics for activities (computed once per processed data)"""
+        return self._activity_stats
+    
+    @cached_property
+    def _activity_stats(self):
+        """Summary statistics for activities"""
         if self.processed_data is None:
             self.process_data()
         
         stats = {}
         
         # Total hours per activity type
-        total_hours = self.processed_data['Activity_Type'].value_counts() * 0.5
+        total_hours = self.activity_hours
         stats['total_hours'] = total_hours.to_dict()
         
         # Hours by day of week
-        daily_hours = self.processed_data.groupby(['Day', 'Activity_Type']).size() * 0.5
+        daily_hours = self._block_counts('Day', 'Activity_Type') * self.HOURS_PER_BLOCK
         stats['daily_hours'] = daily_hours.to_dict()
         
         # Monthly averages
-        monthly_hours = self.processed_data.groupby(['Month', 'Activity_Type']).size() * 0.5
-        monthly_avg = monthly_hours.groupby('Activity_Type').mean()
+        monthly_hours = self._block_counts('Month', 'Activity_Type') * self.HOURS_PER_BLOCK
+        monthly_avg = monthly_hours.groupby('Activity_Type', observed=True).mean()
         stats['monthly_averages'] = monthly_avg.to_dict()
         
-        # Most common specific activities with cleaning
-        activity_details = self.processed_data[self.processed_data['Activity_Detail'] != ''].copy()
-        
-        # Clean activity details
-        activity_details['Activity_Detail'] = (
-            activity_details['Activity_Detail']
+        # Most common specific activities with cleaning; only the detail
+        # column is touched, so the rest of the frame is never copied
+        details = self.processed_data['Activity_Detail']
+        mask = details != ''
+        
+        # Clean activity details. The same details recur across days and
+        # weeks, so each distinct detail is cleaned once and mapped back.
+        detail_codes, unique_details = pd.factorize(details[mask])
+        # The replacements match these strings literally, as they always
+        # have; treating them as regexes would change the reported details
+        cleaned_unique = (
+            pd.Series(unique_details)
             .str.strip()
-            .str.replace(r'\s+', ' ')  # Replace multiple spaces with single space
-            .str.replace(r'[/\\]', '-')  # Replace slashes with hyphens
+            .str.replace(r'\s+', ' ', regex=False)
+            .str.replace(r'[/\\]', '-', regex=False)
+        )
+        cleaned_details = pd.Series(
+            cleaned_unique.to_numpy()[detail_codes], index=details.index[mask], name=details.name
         )
         
         # Group by both type and detail
         activity_counts = (
-            activity_details
-            .groupby(['Activity_Type', 'Activity_Detail'])
+            cleaned_details
+            .groupby([self.processed_data.loc[mask, 'Activity_Type'], cleaned_details], observed=True)
             .size()
-            * 0.5
+            * self.HOURS_PER_BLOCK
         )
         
         # Get top 10 activities with their types
@@ -286,17 +430,26 @@ class TimeAnalyzer:
         """Save all plots to the specified directory"""
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        monthly_dist = self.plot_monthly_distribution()
-        monthly_dist.write_html(Path(output_dir) / "monthly_distribution.html")
-        
-        weekly_dist = self.plot_weekly_distribution()
-        weekly_dist.write_html(Path(output_dir) / "weekly_distribution.html")
-        
-        daily_dist = self.plot_daily_distribution()
-        daily_dist.write_html(Path(output_dir) / "daily_distribution.html")
+        plots = {
+            "monthly_distribution.html": self.plot_monthly_distribution(),
+            "weekly_distribution.html": self.plot_weekly_distribution(),
+            "daily_distribution.html": self.plot_daily_distribution(),
+            "overall_distribution.html": self.plot_weekly_summary(),
+        }
         
-        overall_dist = self.plot_weekly_summary()
-        overall_dist.write_html(Path(output_dir) / "overall_distribution.html")
+        # The figures are independent, so serialize and write them concurrently.
+        # plotly.js is loaded from the CDN instead of being embedded in every
+        # file, and the freshly built figures are not validated again.
+        with ThreadPoolExecutor(max_workers=len(plots)) as executor:
+            futures = [
+                executor.submit(
+                    fig.write_html, Path(output_dir) / filename,
+                    include_plotlyjs='cdn', validate=False
+                )
+                for filename, fig in plots.items()
+            ]
+            for future in futures:
+                future.result()
         
         print(f"Plots saved to {output_dir}")
     
@@ -333,30 +486,22 @@ class TimeAnalyzer:
         stats = []
         
         # Daily statistics by activity type
-        daily_stats = (
-            self.processed_data
-            .groupby(['Month', 'Week', 'Day', 'Activity_Type'])
-            .agg({
-                'Activity_Detail': 'count',  # Number of 30-min blocks
-            })
-            .reset_index()
-        )
-        daily_stats['Hours'] = daily_stats['Activity_Detail'] * 0.5
-        daily_stats = daily_stats.rename(columns={'Activity_Detail': 'Blocks'})
+        daily_stats = self._base_counts.reset_index(name='Blocks')
+        daily_stats['Hours'] = daily_stats['Blocks'] * self.HOURS_PER_BLOCK
         
         # Specific activity statistics
         activity_stats = (
             self.processed_data[self.processed_data['Activity_Detail'] != '']
-            .groupby(['Month', 'Week', 'Day', 'Activity_Type', 'Activity_Detail'])
+            .groupby(['Month', 'Week', 'Day', 'Activity_Type', 'Activity_Detail'], observed=True)
             .size()
             .reset_index(name='Blocks')
         )
-        activity_stats['Hours'] = activity_stats['Blocks'] * 0.5
+        activity_stats['Hours'] = activity_stats['Blocks'] * self.HOURS_PER_BLOCK
         
         # Time slot analysis
         time_stats = (
             self.processed_data
-            .groupby(['Time', 'Activity_Type'])
+            .groupby(['Time', 'Activity_Type'], observed=True)
             .size()
             .reset_index(name='Frequency')
         )
@@ -365,38 +510,50 @@ class TimeAnalyzer:
         output_dir = Path('time_analysis_output/detailed_stats')
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Daily summary by activity type
-        daily_stats.to_csv(output_dir / 'daily_activity_summary.csv', index=False)
-        
-        # Specific activities details
-        activity_stats.to_csv(output_dir / 'specific_activities.csv', index=False)
-        
-        # Time slot patterns
-        time_stats.to_csv(output_dir / 'time_slot_patterns.csv', index=False)
-        
-        # Generate summary statistics
-        summary_stats = {
-            'total_blocks_by_type': self.processed_data['Activity_Type'].value_counts().to_dict(),
-            'total_hours_by_type': (self.processed_data['Activity_Type'].value_counts() * 0.5).to_dict(),
-            'days_tracked': len(self.processed_data['Day'].unique()),
-            'weeks_tracked': len(self.processed_data.groupby(['Month', 'Week'])),
-            'most_common_activities': (
-                self.processed_data[self.processed_data['Activity_Detail'] != '']
-                ['Activity_Detail'].value_counts().head(20).to_dict()
-            ),
-            'activity_type_by_day': (
-                self.processed_data
-                .groupby('Day')['Activity_Type']
-                .value_counts()
-                .unstack(fill_value=0)
-                .to_dict()
-            )
-        }
-        
-        # Save summary statistics as JSON
-        import json
-        with open(output_dir / 'summary_statistics.json', 'w') as f:
-            json.dump(summary_stats, f, indent=2)
+        # The files are independent, so write them concurrently; the summary
+        # statistics are computed while the CSVs are being written
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = []
+            
+            # Daily summary by activity type
+            futures.append(executor.submit(
+                _write_csv, daily_stats, output_dir / 'daily_activity_summary.csv'
+            ))
+            
+            # Specific activities details
+            futures.append(executor.submit(
+                _write_csv, activity_stats, output_dir / 'specific_activities.csv'
+            ))
+            
+            # Time slot patterns
+            futures.append(executor.submit(
+                _write_csv, time_stats, output_dir / 'time_slot_patterns.csv'
+            ))
+            
+            # Generate summary statistics
+            # Per-type totals come from one value_counts, and the day and
+            # week figures from the cached block counts
+            summary_stats = {
+                'total_blocks_by_type': self._type_blocks.to_dict(),
+                'total_hours_by_type': self.activity_hours.to_dict(),
+                'days_tracked': len(self._block_counts('Day')),
+                'weeks_tracked': len(self._block_counts('Month', 'Week')),
+                'most_common_activities': (
+                    self.processed_data['Activity_Detail'].value_counts()
+                    .drop('', errors='ignore').head(20).to_dict()
+                ),
+                'activity_type_by_day': (
+                    self._block_counts('Day', 'Activity_Type').unstack(fill_value=0).to_dict()
+                )
+            }
+            
+            # Save summary statistics as JSON
+            futures.append(executor.submit(
+                _write_json, summary_stats, output_dir / 'summary_statistics.json'
+            ))
+            
+            for future in futures:
+                future.result()
         
         print(f"\nDetailed statistics saved to {output_dir}/")
         print("Files generated:")
@@ -414,6 +571,14 @@ def main():
                        help='Directory to save output plots (default: time_analysis_output)')
     
     args = parser.parse_args()
+    # Loading and processing progress is logged; keep the summary lines on
+    # stdout with the rest of the output, without enabling INFO logging for
+    # third-party libraries
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
     
     analyzer = TimeAnalyzer(args.excel_file, args.year)
     analyzer.save_plots(args.output)